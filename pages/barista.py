@@ -0,0 +1,59 @@
+import streamlit as st
+
+from utils import (
+    NO_DRINKS_HTML,
+    clear_completed_orders,
+    drink_card_html,
+    get_drink_summary,
+    get_pending_orders,
+    total_banner_html,
+)
+
+# BARISTA PAGE
+@st.fragment
+def render_barista():
+    """Render the barista dashboard page as its own rerun fragment"""
+    st.title("👨‍🍳 Barista Dashboard")
+    st.markdown("---")
+
+    try:
+        drink_summary = get_drink_summary()
+
+        if drink_summary:
+            st.markdown("### 📋 Drinks to Make")
+
+            # One st.markdown for all cards: a single message to the browser
+            # instead of one per drink
+            cards_html = ''.join(drink_card_html(drink, count) for drink, count in drink_summary.items())
+            st.markdown(cards_html, unsafe_allow_html=True)
+
+            # Summary
+            total_drinks = sum(drink_summary.values())
+            st.markdown(total_banner_html(total_drinks), unsafe_allow_html=True)
+
+            # Show order details for reference
+            st.markdown("---")
+            st.markdown("### 📄 Order Details (for reference)")
+            pending_orders = get_pending_orders()
+
+            for order in pending_orders:
+                order_num = order.get('order_number', 'Unknown')
+                order_type = order.get('order_type', 'dine_in')
+                type_icon = "🥤" if order_type == 'takeaway' else "🪑"
+                drinks = order.get('drinks', {})
+
+                with st.expander(f"{type_icon} {order_num}"):
+                    for drink, qty in drinks.items():
+                        st.write(f"• {drink}: {qty}")
+
+            # Clear completed orders button
+            if st.button("🗑️ Clear Completed Orders", use_container_width=True):
+                # Skips the rerun entirely when there was nothing to clear
+                if clear_completed_orders():
+                    st.rerun()
+        else:
+            st.markdown(NO_DRINKS_HTML, unsafe_allow_html=True)
+    except Exception as e:
+        st.error("Error loading barista dashboard")
+
+render_barista()
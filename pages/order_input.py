@@ -0,0 +1,125 @@
+import streamlit as st
+
+from utils import COFFEE_ROWS, DRINK_KEYS, QTY_WIDGET_KEYS, add_order, get_recent_orders
+
+def _reset_order_form():
+    """Zero every quantity widget; only valid before they instantiate"""
+    for hot_widget, iced_widget in QTY_WIDGET_KEYS.values():
+        st.session_state[hot_widget] = 0
+        st.session_state[iced_widget] = 0
+
+# ORDER INPUT PAGE
+@st.fragment
+def render_order_input():
+    """Render the order entry page
+
+    Runs as a fragment so interactions here rerun only the page body,
+    not the sidebar metric or navigation. The explicit st.rerun() calls
+    below keep their default app scope on purpose: form resets must
+    reach the widgets on the next full pass.
+    """
+    # Widget keys can't be written after their widgets render, so resets
+    # requested by the submit/clear handlers are applied here on the rerun
+    if st.session_state.pop('reset_order_form', False):
+        _reset_order_form()
+
+    st.title("☕ Coffee Order")
+    st.markdown("---")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # Order type selection at the top
+        st.subheader("🏪 Order Type")
+        order_type_col1, order_type_col2 = st.columns(2)
+
+        with order_type_col1:
+            if st.button("🥤 TAKEAWAY",
+                        use_container_width=True,
+                        type="primary" if st.session_state.order_type == 'takeaway' else "secondary"):
+                # Only rerun when this actually changes something
+                if st.session_state.order_type != 'takeaway':
+                    st.session_state.order_type = 'takeaway'
+                    st.rerun()
+
+        with order_type_col2:
+            if st.button("🪑 DINE IN",
+                        use_container_width=True,
+                        type="primary" if st.session_state.order_type == 'dine_in' else "secondary"):
+                if st.session_state.order_type != 'dine_in':
+                    st.session_state.order_type = 'dine_in'
+                    st.rerun()
+
+        # Show selected order type
+        order_type_display = "🥤 TAKEAWAY" if st.session_state.order_type == 'takeaway' else "🪑 DINE IN"
+        st.info(f"Current order type: **{order_type_display}**")
+
+        st.markdown("---")
+
+        st.subheader("Build Your Order")
+
+        # Quantity edits batch into a single submit rerun instead of one
+        # full rerun per +/- click
+        with st.form("order_form"):
+            st.markdown("### Select Drinks")
+
+            selected_drinks = {}
+
+            # One st.columns call for the whole grid; rows stack into the
+            # same two column containers instead of allocating new ones
+            grid_cols = st.columns(2)
+            for row in COFFEE_ROWS:
+                for col, coffee in zip(grid_cols, row):
+                    with col:
+                        st.markdown(f"**{coffee}**")
+                        hot_key, iced_key = DRINK_KEYS[coffee]
+                        hot_widget, iced_widget = QTY_WIDGET_KEYS[coffee]
+                        selected_drinks[hot_key] = st.number_input(
+                            "🔥 Hot", min_value=0, step=1, key=hot_widget)
+                        selected_drinks[iced_key] = st.number_input(
+                            "🧊 Iced", min_value=0, step=1, key=iced_widget)
+                        st.markdown("---")
+
+            submitted = st.form_submit_button("✅ PLACE ORDER", use_container_width=True, type="primary")
+            # Also a submit button: clearing must commit the draft
+            # quantities first, or the reset can't reach them
+            cleared = st.form_submit_button("🗑️ CLEAR ALL", use_container_width=True)
+
+        if submitted:
+            drinks = {drink_key: qty for drink_key, qty in selected_drinks.items() if qty > 0}
+            if drinks:
+                if add_order(drinks, st.session_state.order_type):
+                    # Toast survives the rerun; st.success would be wiped by it
+                    st.toast(f"Order placed! ({order_type_display})", icon="☕")
+                    st.session_state.reset_order_form = True
+                    st.rerun()
+                else:
+                    # Only failure mode left: all 52 card numbers are out
+                    st.error("All 52 order cards are in use - serve some orders first!")
+            else:
+                st.warning("Please select at least one drink!")
+        elif cleared:
+            st.session_state.reset_order_form = True
+            st.rerun()
+
+    with col2:
+        st.subheader("Recent Orders")
+        recent_orders = get_recent_orders()
+
+        if recent_orders:
+            # Already newest first - see get_recent_orders
+            for order in recent_orders:
+                status_icon = "🕐" if order['pending'] else "✅"
+                order_num = order.get('order_number', 'Unknown')
+                order_type = order.get('order_type', 'dine_in')
+                type_icon = "🥤" if order_type == 'takeaway' else "🪑"
+                drinks = order.get('drinks', {})
+                total_cups = order['total_cups']
+
+                with st.expander(f"{status_icon} {type_icon} {order_num} ({total_cups} cups)"):
+                    for drink, qty in drinks.items():
+                        st.write(f"• {drink}: {qty}")
+        else:
+            st.info("No orders yet")
+
+render_order_input()
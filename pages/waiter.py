@@ -0,0 +1,59 @@
+import streamlit as st
+
+from utils import ALL_SERVED_HTML, get_pending_cup_count, get_pending_orders, render_order_card
+
+# WAITER SERVICE PAGE
+@st.fragment
+def render_waiter():
+    """Render the waiter service page
+
+    A fragment itself, with each order card nested as a child fragment
+    so a serve click reruns only that card.
+    """
+    st.title("🍽️ Waiter Service")
+    st.markdown("---")
+
+    try:
+        pending_orders = get_pending_orders()
+
+        if pending_orders:
+            # Separate takeaway and dine-in orders
+            takeaway_orders = [order for order in pending_orders if order.get('order_type') == 'takeaway']
+            dinein_orders = [order for order in pending_orders if order.get('order_type') == 'dine_in']
+
+            # Show takeaway orders first (higher priority)
+            if takeaway_orders:
+                st.markdown("### 🥤 TAKEAWAY Orders (Priority)")
+
+                for order in takeaway_orders:
+                    render_order_card(order)
+
+            # Show dine-in orders
+            if dinein_orders:
+                st.markdown("### 🪑 DINE IN Orders")
+
+                for order in dinein_orders:
+                    render_order_card(order)
+
+            # Summary - maintained incrementally by add_order/mark_order_completed
+            total_pending_cups = get_pending_cup_count()
+            st.markdown(f"""
+            <div style="
+                background-color: #d1ecf1;
+                padding: 15px;
+                margin: 20px 0;
+                border-radius: 10px;
+                text-align: center;
+            ">
+                <h2 style="margin: 0; color: #0c5460;">
+                    {len(takeaway_orders)} Takeaway | {len(dinein_orders)} Dine-in | {total_pending_cups} Total Cups
+                </h2>
+            </div>
+            """, unsafe_allow_html=True)
+
+        else:
+            st.markdown(ALL_SERVED_HTML, unsafe_allow_html=True)
+    except Exception as e:
+        st.error("Error loading waiter service page")
+
+render_waiter()
@@ -0,0 +1,365 @@
+import datetime
+import random
+import streamlit as st
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+# Bound once; saves the module-attribute walk in per-order paths
+_fromtimestamp = datetime.datetime.fromtimestamp
+
+def _today_key() -> int:
+    """Key for the daily served tally
+
+    An ordinal int hashes cheaper than a date string and skips the
+    formatting call; datetime.date.fromordinal() recovers the date if a
+    report ever needs it.
+    """
+    return datetime.date.today().toordinal()
+
+# Poker card configuration
+SUITS = ['♠️', '♥️', '♦️', '♣️']
+NUMBERS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+@st.cache_resource
+def _all_cards() -> tuple:
+    """Enumerate the 52-card deck once per server process"""
+    return tuple(f"{suit}{number}" for suit in SUITS for number in NUMBERS)
+
+ALL_CARDS = _all_cards()
+CARD_INDEX = {card: i for i, card in enumerate(ALL_CARDS)}
+FULL_DECK_MASK = (1 << len(ALL_CARDS)) - 1
+COFFEE_TYPES = ['Latte', 'Americano', 'Cappuccino', 'Mocha', 'Long Black', 'Fresh Milk']
+# Two-column layout for the order page, fixed at import time
+COFFEE_ROWS = [COFFEE_TYPES[i:i + 2] for i in range(0, len(COFFEE_TYPES), 2)]
+# Drink names and quantity-widget keys, materialized once instead of
+# re-interpolated on every rerun
+DRINK_KEYS = {coffee: (f"Hot {coffee}", f"Iced {coffee}") for coffee in COFFEE_TYPES}
+QTY_WIDGET_KEYS = {coffee: (f"qty_hot_{coffee}", f"qty_iced_{coffee}") for coffee in COFFEE_TYPES}
+
+@st.cache_resource
+def get_store() -> dict:
+    """Process-wide order store shared by every session and tab
+
+    The order taker, barista, and waiter each work from their own
+    browser tab, so the order book lives in one cache_resource
+    singleton rather than per-session state. Mutations take the RLock;
+    it is reentrant so helpers can call each other while holding it.
+    """
+    return {
+        'orders': [],
+        'orders_by_id': {},
+        'next_order_id': 1,  # never reused, unlike card numbers
+        'drink_counts': Counter(),
+        'pending_orders': deque(),
+        'pending_cup_count': 0,
+        'completed_count': 0,
+        'recent_orders': deque(maxlen=5),  # newest first, self-bounding
+        'daily_served': defaultdict(int),
+        'used_mask': 0,  # bit i set => ALL_CARDS[i] handed out
+        'lock': threading.RLock(),
+    }
+
+def init_session_state():
+    """Initialize per-session UI state; called from the entrypoint on every rerun"""
+    if 'order_type' not in st.session_state:
+        st.session_state.order_type = 'dine_in'  # Default to dine-in
+
+# Static page blocks - built once at import, not on every rerun
+NO_DRINKS_HTML = """
+<div style="
+    text-align: center;
+    padding: 50px;
+    background-color: #f8f9fa;
+    border-radius: 10px;
+    margin: 20px 0;
+">
+    <h1 style="color: #6c757d;">☕ No drinks to make!</h1>
+    <p style="font-size: 1.2em; color: #6c757d;">All caught up! 🎉</p>
+</div>
+"""
+
+ALL_SERVED_HTML = """
+<div style="
+    text-align: center;
+    padding: 50px;
+    background-color: #d4edda;
+    border-radius: 10px;
+    margin: 20px 0;
+">
+    <h1 style="color: #155724;">🎉 All orders served!</h1>
+    <p style="font-size: 1.2em; color: #155724;">Great job! No pending orders.</p>
+</div>
+"""
+
+FOOTER_MD = "Made with ❤️ and ☕"
+
+# Card templates - parsed once at import; render paths only .format() them
+DRINK_CARD_TMPL = """
+<div style="
+    background-color: #f0f2f6;
+    padding: 20px;
+    margin: 10px 0;
+    border-radius: 10px;
+    border-left: 5px solid #ff6b6b;
+">
+    <h2 style="margin: 0; color: #2c3e50;">{drink}</h2>
+    <h1 style="margin: 5px 0; color: #e74c3c; font-size: 3em;">{count}</h1>
+</div>
+"""
+
+TOTAL_BANNER_TMPL = """
+<div style="
+    background-color: #e8f5e8;
+    padding: 15px;
+    margin: 20px 0;
+    border-radius: 10px;
+    text-align: center;
+">
+    <h2 style="margin: 0; color: #27ae60;">Total Drinks: {total}</h2>
+</div>
+"""
+
+ORDER_CARD_TMPL = """
+<div style="
+    background-color: {bg_color};
+    padding: 20px;
+    margin: 10px 0;
+    border-radius: 10px;
+    border-left: 5px solid {border_color};
+">
+    <h1 style="margin: 0; color: #856404; font-size: 2.5em;">{icon} {order_num}</h1>
+    <h3 style="margin: 10px 0; color: #495057;">{label} ({total_cups} cups)</h3>
+    <div style="margin: 10px 0; color: #495057; font-size: 1.1em;">
+        {drinks_text}
+    </div>
+    <p style="margin: 0; color: #6c757d; font-size: 0.9em;">
+        Ordered: {order_time}
+    </p>
+</div>
+"""
+
+def generate_order_number():
+    """Draw a random unused poker card tracked by a 52-bit deck mask
+
+    Cards return to the deck when their order completes, so a drawn
+    card is never shared with a pending order. Returns None when all
+    52 cards are held by outstanding orders.
+    """
+    store = get_store()
+    with store['lock']:
+        free = ~store['used_mask'] & FULL_DECK_MASK
+
+        if free == 0:
+            # Every card is attached to a pending order; resetting the
+            # mask here would hand out duplicates, so refuse instead
+            return None
+
+        # Walk down to a uniformly random set bit of the free mask
+        for _ in range(random.randrange(free.bit_count())):
+            free &= free - 1  # clear lowest set bit
+        idx = (free & -free).bit_length() - 1
+
+        store['used_mask'] |= 1 << idx
+        return ALL_CARDS[idx]
+
+def add_order(drinks_dict: dict, order_type: str = 'dine_in'):
+    """Add a new order with multiple drinks and order type"""
+    if not drinks_dict:
+        return False
+
+    store = get_store()
+    with store['lock']:
+        order_number = generate_order_number()
+        if order_number is None:
+            # Deck exhausted: 52 orders outstanding at once
+            return False
+        timestamp = time.time()
+        order_id = store['next_order_id']
+        store['next_order_id'] = order_id + 1
+        order = {
+            # Unique handle; the card number is display-only and recycles
+            'order_id': order_id,
+            'order_number': order_number,
+            'drinks': drinks_dict.copy(),  # Dictionary of {drink_key: quantity}
+            'order_type': order_type,  # 'takeaway' or 'dine_in'
+            'timestamp': timestamp,
+            # Formatted once here so render loops never touch datetime
+            'time_str': _fromtimestamp(timestamp).strftime('%H:%M:%S'),
+            # Summed once; every display and tally reads this field
+            'total_cups': sum(drinks_dict.values()),
+            # Drinks are immutable after placement, so the card body
+            # is rendered here rather than on every waiter rerun
+            'drinks_html': "<br>".join(
+                f"• {qty}x {drink}" if qty > 1 else f"• {drink}"
+                for drink, qty in drinks_dict.items()),
+            'pending': True  # cheaper to test than a status string
+        }
+        store['orders'].append(order)
+        # Index by unique id (same dict reference, so mutations propagate)
+        store['orders_by_id'][order_id] = order
+        # Keep the barista summary up to date incrementally
+        store['drink_counts'].update(order['drinks'])
+        # Orders arrive in timestamp order, so the deque stays sorted
+        store['pending_orders'].append(order)
+        store['pending_cup_count'] += order['total_cups']
+        # maxlen evicts the oldest entry for us
+        store['recent_orders'].appendleft(order)
+    return True
+
+def compact_orders():
+    """Drop completed orders, rebuilding index and queue in one pass"""
+    store = get_store()
+    with store['lock']:
+        kept = []
+        index = {}
+        mask = 0
+        for order in store['orders']:
+            if order['pending']:
+                kept.append(order)
+                index[order['order_id']] = order
+                mask |= 1 << CARD_INDEX[order['order_number']]
+        store['orders'] = kept
+        store['orders_by_id'] = index
+        store['pending_orders'] = deque(kept)
+        # Only pending orders hold cards; everything else is back in the deck
+        store['used_mask'] = mask
+        store['completed_count'] = 0
+
+def clear_completed_orders() -> bool:
+    """Compact away completed orders; returns False when there were none"""
+    store = get_store()
+    with store['lock']:
+        # Short-circuits on the first completed order
+        if not any(not order['pending'] for order in store['orders']):
+            return False
+        compact_orders()
+        return True
+
+def get_pending_orders():
+    """Get all pending orders sorted by timestamp"""
+    # The deque is already in timestamp (insertion) order, and add_order
+    # always sets status, so the hot loop can index directly. Snapshot
+    # under the lock so another tab's mutation can't race the iteration.
+    store = get_store()
+    with store['lock']:
+        return [order for order in store['pending_orders'] if order['pending']]
+
+def get_drink_summary():
+    """Get aggregated drink counts for barista"""
+    store = get_store()
+    with store['lock']:
+        return Counter(store['drink_counts'])
+
+def get_pending_cup_count() -> int:
+    """Total cups across pending orders, maintained incrementally"""
+    return get_store()['pending_cup_count']
+
+def get_recent_orders():
+    """Snapshot of the most recently placed orders, newest first
+
+    Backed by a maxlen deque kept up to date in add_order, so there is
+    no per-rerun slice of the full order history.
+    """
+    store = get_store()
+    with store['lock']:
+        return list(store['recent_orders'])
+
+def mark_order_completed(order_id: int):
+    """Mark an order as completed and update daily served count"""
+    today = _today_key()
+    store = get_store()
+
+    with store['lock']:
+        order = store['orders_by_id'].get(order_id)
+        if order is None or not order['pending']:
+            # Unknown or already-served order; don't touch the aggregates twice
+            return False
+
+        order['pending'] = False
+        # Return the card to the deck now that the order is done with it
+        store['used_mask'] &= ~(1 << CARD_INDEX[order['order_number']])
+
+        drinks = order['drinks']
+        total_cups = order['total_cups']
+
+        # This order's drinks no longer need making
+        store['drink_counts'].subtract(drinks)
+        store['drink_counts'] += Counter()  # drop zero/negative entries
+        store['pending_cup_count'] -= total_cups
+
+        # Opportunistically drop completed orders from the head of the queue
+        pending = store['pending_orders']
+        while pending and not pending[0]['pending']:
+            pending.popleft()
+
+        # Update daily served count - defaultdict makes this one lookup
+        store['daily_served'][today] += total_cups
+
+        # Amortized cleanup: once completed orders dominate a sizable
+        # history, rebuild everything in one pass instead of letting the
+        # clear button pay for the whole backlog at once
+        store['completed_count'] += 1
+        if (store['completed_count'] > 16
+                and store['completed_count'] * 2 > len(store['orders'])):
+            compact_orders()
+
+    return True
+
+def get_today_served():
+    """Get total cups served today"""
+    return get_store()['daily_served'].get(_today_key(), 0)
+
+@st.cache_data(max_entries=256)
+def drink_card_html(drink: str, count: int) -> str:
+    """Render a barista drink card; memoized per (drink, count)"""
+    return DRINK_CARD_TMPL.format(drink=drink, count=count)
+
+@st.cache_data(max_entries=256)
+def total_banner_html(total: int) -> str:
+    """Render the barista totals banner; memoized per total"""
+    return TOTAL_BANNER_TMPL.format(total=total)
+
+@st.cache_data(max_entries=256)
+def order_card_html(order_num: str, order_type: str, total_cups: int, drinks_text: str, order_time: str) -> str:
+    """Render a waiter order card; memoized per order contents"""
+    if order_type == 'takeaway':
+        bg_color, border_color, icon, label = '#ffeaa7', '#fdcb6e', '🥤', 'TAKEAWAY'
+    else:
+        bg_color, border_color, icon, label = '#fff3cd', '#ffc107', '🪑', 'DINE IN'
+    return ORDER_CARD_TMPL.format(
+        bg_color=bg_color,
+        border_color=border_color,
+        icon=icon,
+        label=label,
+        order_num=order_num,
+        total_cups=total_cups,
+        drinks_text=drinks_text,
+        order_time=order_time,
+    )
+
+@st.fragment
+def render_order_card(order):
+    """Render one waiter order card; serving it reruns only this fragment"""
+    if not order['pending']:
+        return
+
+    order_num = order['order_number']
+    order_type = order['order_type']
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        st.markdown(
+            order_card_html(order_num, order_type, order['total_cups'],
+                            order['drinks_html'], order['time_str']),
+            unsafe_allow_html=True)
+
+    with col2:
+        button_label = "✅ Ready" if order_type == 'takeaway' else "✅ Served"
+        # Keyed on the unique id: card numbers recycle and may repeat on screen
+        if st.button(button_label, key=f"serve_{order['order_id']}", use_container_width=True):
+            if mark_order_completed(order['order_id']):
+                served_word = "ready" if order_type == 'takeaway' else "served"
+                st.toast(f"Order {order_num} {served_word}!", icon="✅")
+                st.balloons()
+                st.rerun(scope="fragment")